@@ -13,10 +13,12 @@ def main() -> None:
     index = os.environ.get("SEARCH_INDEX", "papers")
     client = OpenSearch(hosts=[host])
 
+    # Mirrors /search: field-sorted results, so the match runs in filter context
     query: dict[str, Any] = {
         "bool": {
-            "must": {"multi_match": {"query": "transformer", "fields": ["title^2", "abstract"]}},
-            "filter": [],
+            "filter": [
+                {"multi_match": {"query": "transformer", "fields": ["title^2", "abstract"]}}
+            ],
         }
     }
     sort = [{"fetched_at": {"order": "desc"}}]
@@ -5,23 +5,34 @@ import json
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
+def build_session() -> requests.Session:
+    """Create a pooled HTTP session so repeated probes reuse keep-alive connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def perform_check(
-    base_url: str, query: str, size: int, max_latency_ms: int
+    session: requests.Session, base_url: str, query: str, size: int, max_latency_ms: int
 ) -> tuple[bool, dict[str, Any]]:
     t0 = _now_ms()
     url = f"{base_url.rstrip('/')}/search"
     try:
-        resp = requests.get(url, params={"q": query, "size": size}, timeout=10)
+        resp = session.get(url, params={"q": query, "size": size}, timeout=10)
         latency_ms = _now_ms() - t0
         ok = resp.status_code == 200
         payload: dict[str, Any] = {
@@ -50,14 +61,18 @@ def perform_check(
         return False, {"query": query, "error": str(e), "latency_ms": _now_ms() - t0}
 
 
-def post_webhook(webhook_url: str, event_type: str, payload: dict[str, Any]) -> None:
+def post_webhook(
+    session: requests.Session, webhook_url: str, event_type: str, payload: dict[str, Any]
+) -> None:
     headers = {"Content-Type": "application/json"}
     body = json.dumps({"type": event_type, "payload": payload})
     with suppress(Exception):
-        requests.post(webhook_url, data=body, headers=headers, timeout=5)
+        session.post(webhook_url, data=body, headers=headers, timeout=5)
 
 
-def post_telemetry(base_url: str, event_type: str, payload: dict[str, Any]) -> None:
+def post_telemetry(
+    session: requests.Session, base_url: str, event_type: str, payload: dict[str, Any]
+) -> None:
     url = f"{base_url.rstrip('/')}/ui/telemetry"
     body = {
         "session_id": "synthetic",
@@ -66,18 +81,27 @@ def post_telemetry(base_url: str, event_type: str, payload: dict[str, Any]) -> N
         "payload": payload,
     }
     with suppress(Exception):
-        requests.post(
+        session.post(
             url, data=json.dumps(body), headers={"Content-Type": "application/json"}, timeout=5
         )
 
 
 def run_once(
-    base_url: str, queries: list[str], size: int, max_latency_ms: int, webhook_url: str | None
+    session: requests.Session,
+    base_url: str,
+    queries: list[str],
+    size: int,
+    max_latency_ms: int,
+    webhook_url: str | None,
 ) -> int:
     failures: list[dict[str, Any]] = []
     results: list[dict[str, Any]] = []
-    for q in queries:
-        ok, payload = perform_check(base_url, q, size, max_latency_ms)
+    # Probe all queries concurrently over the shared pool; wall time ~ slowest check
+    with ThreadPoolExecutor(max_workers=max(1, min(len(queries), 16))) as pool:
+        checks = list(
+            pool.map(lambda q: perform_check(session, base_url, q, size, max_latency_ms), queries)
+        )
+    for ok, payload in checks:
         results.append({"ok": ok, **payload})
         if not ok:
             failures.append(payload)
@@ -91,9 +115,9 @@ def run_once(
             "ts": int(time.time()),
         }
         if webhook_url:
-            post_webhook(webhook_url, "synthetic_monitor_failure", summary)
+            post_webhook(session, webhook_url, "synthetic_monitor_failure", summary)
         else:
-            post_telemetry(base_url, "synthetic_failure", summary)
+            post_telemetry(session, base_url, "synthetic_failure", summary)
     # Print concise output for logs/cron
     for r in results:
         status = "OK" if r.get("ok") else "FAIL"
@@ -104,6 +128,32 @@ def run_once(
     return 0 if not failures else 2
 
 
+def run(
+    base_url: str,
+    queries: list[str],
+    size: int = 5,
+    max_latency_ms: int = 2000,
+    interval: int = 0,
+    webhook_url: str | None = None,
+) -> int:
+    """Run the checks once (interval <= 0) or forever every `interval` seconds."""
+    # One session for the lifetime of the process so daemon iterations reuse connections
+    with build_session() as session:
+        if interval <= 0:
+            return run_once(session, base_url, queries, size, max_latency_ms, webhook_url)
+
+        # Daemon mode
+        exit_code = 0
+        try:
+            while True:
+                code = run_once(session, base_url, queries, size, max_latency_ms, webhook_url)
+                exit_code = code if code != 0 else exit_code
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        return exit_code
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Synthetic monitor for UI/API health")
     parser.add_argument(
@@ -115,6 +165,13 @@ def main() -> int:
         help="Comma-separated list of queries",
     )
     parser.add_argument("--size", type=int, default=int(os.environ.get("MONITOR_SIZE", 5)))
+    modes = ["deep", "liveness"]
+    parser.add_argument(
+        "--mode",
+        choices=modes,
+        default=os.environ.get("MONITOR_MODE", "deep"),
+        help="liveness only checks hit totals (size=0); deep fetches a page of hits",
+    )
     parser.add_argument(
         "--max-latency-ms",
         type=int,
@@ -132,23 +189,23 @@ def main() -> int:
         help="Override alert webhook URL (defaults to ALERT_WEBHOOK_URL env)",
     )
     args = parser.parse_args()
+    # argparse doesn't check defaults against `choices`, so validate MONITOR_MODE here
+    if args.mode not in modes:
+        parser.error(f"invalid MONITOR_MODE {args.mode!r} (choose from {', '.join(modes)})")
 
     queries = [q.strip() for q in str(args.queries).split(",") if q.strip()]
     webhook_url = args.webhook_url.strip() or None
-
-    if args.interval <= 0:
-        return run_once(args.base_url, queries, args.size, args.max_latency_ms, webhook_url)
-
-    # Daemon mode
-    exit_code = 0
-    try:
-        while True:
-            code = run_once(args.base_url, queries, args.size, args.max_latency_ms, webhook_url)
-            exit_code = code if code != 0 else exit_code
-            time.sleep(args.interval)
-    except KeyboardInterrupt:
-        pass
-    return exit_code
+    # Liveness probes only need the total, so don't have the API fetch or serialize any hits
+    size = 0 if args.mode == "liveness" else args.size
+
+    return run(
+        args.base_url,
+        queries,
+        size=size,
+        max_latency_ms=args.max_latency_ms,
+        interval=args.interval,
+        webhook_url=webhook_url,
+    )
 
 
 if __name__ == "__main__":
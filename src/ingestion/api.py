@@ -1,49 +1,295 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from contextlib import asynccontextmanager
+from collections.abc import Iterator
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from time import perf_counter
 from typing import Any
 
+import orjson
+import requests
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from opensearchpy import OpenSearch
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.serializer import JSONSerializer
+from requests.adapters import HTTPAdapter
+from sqlalchemy import and_, case, func, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.elements import ColumnElement
+from urllib3.util.retry import Retry
 
 from .config import Settings
 from .db import Base, create_session_factory
 from .models import Paper, UiEvent
-from .utils import license_permits_pdf_storage
+from .utils import CircuitBreaker, license_permits_pdf_storage
+
+
+@lru_cache(maxsize=8)
+def _session_factory_for(database_url: str) -> sessionmaker:
+    return create_session_factory(database_url)
+
+
+def _get_session_factory() -> sessionmaker:
+    """Return a session factory whose engine (and connection pool) is shared across requests."""
+    return _session_factory_for(Settings.from_env().database_url)
+
+
+@lru_cache(maxsize=1)
+def _semantic_model(model_name: str) -> Any:
+    """Load the sentence-transformers model once per process; loading is slow and memory-heavy."""
+    from sentence_transformers import SentenceTransformer  # type: ignore
+
+    return SentenceTransformer(model_name)
+
+
+_TELEMETRY_QUEUE_MAXSIZE = 10_000
+_TELEMETRY_BATCH_SIZE = 100
+_TELEMETRY_FLUSH_SECONDS = 0.5
+
+
+def _insert_ui_events(rows: list[dict[str, Any]]) -> None:
+    session_factory = _get_session_factory()
+    with session_factory() as session:
+        session.execute(insert(UiEvent), rows)
+        session.commit()
+
+
+def _insert_ui_event_batch(rows: list[dict[str, Any]]) -> None:
+    """Insert a batch in one statement; if that fails, retry row by row to drop only bad rows.
+
+    Payloads come from unauthenticated clients, and one value the database rejects (e.g. a
+    NUL byte in JSONB) fails the whole multi-row insert.
+    """
+    try:
+        _insert_ui_events(rows)
+    except Exception:
+        if len(rows) == 1:
+            return
+        for row in rows:
+            with suppress(Exception):
+                _insert_ui_events([row])
+
+
+async def _flush_telemetry(queue: asyncio.Queue[dict[str, Any] | None]) -> None:
+    """Write queued UI events in batches of up to N rows or T seconds; None stops the loop."""
+    loop = asyncio.get_running_loop()
+    stopping = False
+    while not stopping:
+        first = await queue.get()
+        if first is None:
+            return
+        batch = [first]
+        deadline = loop.time() + _TELEMETRY_FLUSH_SECONDS
+        while len(batch) < _TELEMETRY_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+        # Telemetry is best-effort; a failed insert must not kill the writer
+        await asyncio.to_thread(_insert_ui_event_batch, batch)
+
+
+async def _record_ui_event(request: Request, row: dict[str, Any]) -> None:
+    """Queue a UI event for the batch writer, or insert it directly if none is running."""
+    queue = getattr(request.app.state, "telemetry_queue", None)
+    if queue is not None:
+        try:
+            queue.put_nowait(row)
+            return
+        except asyncio.QueueFull:
+            pass
+    await asyncio.to_thread(_insert_ui_events, [row])
 
 
 @asynccontextmanager
-async def _lifespan(_: FastAPI):
-    # Ensure DB schema exists on startup
+async def _lifespan(app_: FastAPI):
+    # Ensure DB schema exists on startup; this also warms the shared engine
     settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
+    session_factory = _get_session_factory()
     with session_factory() as session:
         engine = session.get_bind()
         Base.metadata.create_all(engine)
-    yield
+        # create_all skips indexes on tables that already exist
+        for index in UiEvent.__table__.indexes:
+            index.create(engine, checkfirst=True)
+    # Preload the re-ranking model so the first semantic query doesn't pay the cold start
+    if settings.enable_semantic:
+        with suppress(Exception):
+            _semantic_model(settings.semantic_model)
+    # Write-behind buffer for UI telemetry; drained on shutdown
+    queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(maxsize=_TELEMETRY_QUEUE_MAXSIZE)
+    flusher = asyncio.create_task(_flush_telemetry(queue))
+    app_.state.telemetry_queue = queue
+    try:
+        yield
+    finally:
+        app_.state.telemetry_queue = None
+        await queue.put(None)
+        await flusher
+
+
+app = FastAPI(
+    title="Literature Search API",
+    version="0.2.0",
+    lifespan=_lifespan,
+    default_response_class=ORJSONResponse,
+)
+templates = Jinja2Templates(directory="src/ingestion/templates")
 
 
-app = FastAPI(title="Literature Search API", version="0.2.0", lifespan=_lifespan)
-templates = Jinja2Templates(directory="src/ingestion/templates")
+class OrjsonSerializer(JSONSerializer):
+    """JSON (de)serializer for the OpenSearch client backed by orjson."""
+
+    def dumps(self, data: Any) -> Any:
+        # don't serialize pre-encoded bodies
+        if isinstance(data, str | bytes):
+            return data
+        try:
+            return orjson.dumps(data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError as e:
+            raise SerializationError(data, e) from e
+
+    def loads(self, s: str) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e) from e
+
+
+@lru_cache(maxsize=4)
+def _client_for(host: str) -> OpenSearch:
+    return OpenSearch(hosts=[host], pool_maxsize=32, serializer=OrjsonSerializer())
 
 
 def _get_client() -> OpenSearch:
+    """Return a process-wide OpenSearch client so its urllib3 pool stays warm between requests."""
     host = os.environ.get("SEARCH_HOST", "http://localhost:9200")
-    return OpenSearch(hosts=[host])
+    return _client_for(host)
 
 
 INDEX_NAME = os.environ.get("SEARCH_INDEX", "papers")
 
+# Only fetch the document fields each endpoint actually returns or renders
+_SEARCH_SOURCE_FIELDS = [
+    "title",
+    "abstract",
+    "summary",
+    "authors",
+    "year",
+    "venue",
+    "doi",
+    "source",
+    "license",
+    "citation_count",
+    "fetched_at",
+]
+_UI_SOURCE_FIELDS = [
+    "title",
+    "abstract",
+    "summary",
+    "year",
+    "citation_count",
+    "license",
+    "source",
+    "doi",
+    "external_id",
+]
+_SUMMARY_SOURCE_FIELDS = ["title", "summary", "abstract", "year", "citation_count"]
+
+# Shared, read-only query fragments; handlers only build the per-request parts around them
+_MULTI_MATCH_FIELDS = ("title^2", "abstract", "summary")
+_SORT_RECENCY = [{"fetched_at": {"order": "desc"}}]
+_SORT_CITATIONS = [{"citation_count": {"order": "desc"}}]
+
+
+def _build_webhook_session() -> requests.Session:
+    """Keep-alive session for alert webhooks; retries transient failures with backoff."""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        backoff_jitter=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["POST"],
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_webhook_session = _build_webhook_session()
+
+# Stop attempting semantic re-ranking for a while once the model keeps failing
+_semantic_breaker = CircuitBreaker(failure_threshold=5, reset_timeout_seconds=60.0)
+
+
+def _hit_id(hit: dict[str, Any]) -> Any:
+    """Return the hit's document id as an int when numeric (paper ids), else unchanged."""
+    value = hit.get("_id")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+# Read-only stand-in for hours without telemetry; never mutate
+_EMPTY_BUCKET: dict[str, Any] = {
+    "searches": 0,
+    "zero_searches": 0,
+    "avg_latency_ms": None,
+    "details_requests": 0,
+    "details_errors": 0,
+}
+
+
+def _hour_bucket(dialect_name: str) -> ColumnElement[Any]:
+    """SQL expression truncating ``UiEvent.created_at`` to the start of its UTC hour (naive)."""
+    if dialect_name == "postgresql":
+        # date_trunc on a timestamptz truncates in the session time zone, which lands on :30
+        # for zones like Asia/Kolkata; convert to a naive UTC timestamp first
+        return func.date_trunc("hour", func.timezone("UTC", UiEvent.created_at))
+    # SQLite stores timestamps as ISO-8601 text
+    return func.strftime("%Y-%m-%d %H:00:00", UiEvent.created_at)
+
+
+def _payload_number(key: str, dialect_name: str) -> ColumnElement[Any]:
+    """Numeric ``UiEvent.payload[key]``, or NULL when the value is missing or not a JSON number.
+
+    Payloads come from unauthenticated clients; a bare CAST would make the whole aggregate
+    fail (Postgres) on values like ``""`` or ``true``.
+    """
+    value = UiEvent.payload[key].as_float()
+    if dialect_name == "postgresql":
+        is_number = func.jsonb_typeof(UiEvent.payload[key]) == "number"
+    else:
+        is_number = func.json_type(UiEvent.payload, f'$."{key}"').in_(("integer", "real"))
+    return case((is_number, value), else_=None)
+
+
+def _epoch_hour(value: datetime | str) -> int:
+    """Hours since the Unix epoch; naive values (from `_hour_bucket`) are taken to be UTC."""
+    dt = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp()) // 3600
+
 
 @app.get("/paper/{paper_id}")
 def get_paper(paper_id: int) -> dict[str, Any]:
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
+    session_factory = _get_session_factory()
     with session_factory() as session:
         paper = session.get(Paper, paper_id)
         if not paper:
@@ -79,7 +325,7 @@ def search(
     license: str | None = Query(None, alias="license"),
     source: str | None = Query(None),
     sort: str = Query("recency", description="recency|citations"),
-    size: int = Query(20, ge=1, le=100),
+    size: int = Query(20, ge=0, le=100, description="0 returns only the total (liveness)"),
 ) -> dict[str, Any]:
     client = _get_client()
     settings = Settings.from_env()
@@ -88,18 +334,7 @@ def search(
     filter_q: list[dict[str, Any]] = []
 
     if q:
-        must.append(
-            {
-                "multi_match": {
-                    "query": q,
-                    "fields": [
-                        "title^2",
-                        "abstract",
-                        "summary",
-                    ],
-                }
-            }
-        )
+        must.append({"multi_match": {"query": q, "fields": _MULTI_MATCH_FIELDS}})
     if author:
         filter_q.append({"term": {"authors": author}})
     if year_start is not None or year_end is not None:
@@ -114,75 +349,100 @@ def search(
     if source:
         filter_q.append({"term": {"source": source}})
 
-    sort_clause = [{"fetched_at": {"order": "desc"}}]
-    if sort == "citations":
-        sort_clause = [{"citation_count": {"order": "desc"}}]
+    sort_clause = _SORT_CITATIONS if sort == "citations" else _SORT_RECENCY
 
-    query = {"bool": {"must": must or {"match_all": {}}, "filter": filter_q}}
+    # Results are always sorted by a field, so match in filter context and skip BM25 scoring
+    query = {"bool": {"filter": must + filter_q}}
 
+    # Over-fetch only when semantic re-ranking will pick from a wider candidate pool; an open
+    # breaker means it won't (peek at the state: allow() would take the half-open trial slot)
+    rerank = bool(settings.enable_semantic and q and size > 0 and _semantic_breaker.state != "open")
+    fetch_size = max(size, settings.semantic_topk) if rerank else size
     res = client.search(
-        index=INDEX_NAME, body={"query": query, "size": size * 2, "sort": sort_clause}
+        index=INDEX_NAME,
+        body={
+            "query": query,
+            "size": fetch_size,
+            "sort": sort_clause,
+            "track_scores": False,
+            "track_total_hits": True,
+            "_source": {"includes": _SEARCH_SOURCE_FIELDS},
+        },
     )
     hits = [
         {
-            "id": int(h.get("_id")) if str(h.get("_id")).isdigit() else h.get("_id"),
+            "id": _hit_id(h),
             "score": h.get("_score"),
             **h.get("_source", {}),
         }
         for h in res.get("hits", {}).get("hits", [])
     ]
     # Optional semantic re-ranking
-    if settings.enable_semantic and q and hits:
+    if rerank and hits and _semantic_breaker.allow():
         try:
-            from sentence_transformers import SentenceTransformer, util  # type: ignore
+            import numpy as np
 
-            model = SentenceTransformer(settings.semantic_model)
+            model = _semantic_model(settings.semantic_model)
 
             # Prepare texts to embed (prefer summary, then abstract, then title)
             def _text(item: dict[str, Any]) -> str:
                 return item.get("summary") or item.get("abstract") or item.get("title") or ""
 
-            topk = max(1, min(len(hits), settings.semantic_topk))
-            subset = hits[:topk]
-            corpus_texts = [_text(h) for h in subset]
-            query_emb = model.encode([q], normalize_embeddings=True)[0]
-            corpus_embs = model.encode(corpus_texts, normalize_embeddings=True)
-            sims = util.cos_sim(query_emb, corpus_embs).tolist()[0]
-
-            # Compute blended score: semantic + citations + recency
             def _safe(v: Any, default: float = 0.0) -> float:
                 try:
                     return float(v or 0)
                 except Exception:
                     return default
 
-            def _recency_bonus(item: dict[str, Any]) -> float:
-                # naive: newer year -> higher bonus
-                y = _safe(item.get("year"))
-                return y / 2100.0  # scale roughly into 0..1
-
-            for i, item in enumerate(subset):
-                semantic = float(sims[i])
-                citations = _safe(item.get("citation_count"))
-                blended = (
-                    settings.weight_semantic * semantic
-                    + settings.weight_citations * (citations**0.5)
-                    + settings.weight_recency * _recency_bonus(item)
-                )
-                item["_blended_score"] = blended
+            topk = max(1, min(len(hits), settings.semantic_topk))
+            subset = hits[:topk]
+            corpus_texts = [_text(h) for h in subset]
+            # Embed the query alongside the corpus in a single batch
+            embs = model.encode(
+                [q, *corpus_texts], normalize_embeddings=True, convert_to_numpy=True
+            )
+            # Embeddings are normalized, so the dot product is the cosine similarity
+            sims = embs[1:] @ embs[0]
+            citations = np.fromiter(
+                (_safe(h.get("citation_count")) for h in subset), dtype=np.float64, count=topk
+            )
+            # naive recency: newer year -> higher bonus, scaled roughly into 0..1
+            recency = (
+                np.fromiter((_safe(h.get("year")) for h in subset), dtype=np.float64, count=topk)
+                / 2100.0
+            )
+
+            # Compute blended score: semantic + citations + recency
+            blended = (
+                settings.weight_semantic * sims
+                + settings.weight_citations * np.sqrt(np.maximum(citations, 0.0))
+                + settings.weight_recency * recency
+            )
+            weights = {
+                "semantic": settings.weight_semantic,
+                "citations": settings.weight_citations,
+                "recency": settings.weight_recency,
+            }
+            for item, semantic, cites, rec, score in zip(
+                subset,
+                sims.tolist(),
+                citations.tolist(),
+                recency.tolist(),
+                blended.tolist(),
+                strict=True,
+            ):
+                item["_blended_score"] = score
                 item["ranking_breakdown"] = {
                     "semantic": semantic,
-                    "citations": citations,
-                    "recency": _recency_bonus(item),
-                    "weights": {
-                        "semantic": settings.weight_semantic,
-                        "citations": settings.weight_citations,
-                        "recency": settings.weight_recency,
-                    },
+                    "citations": cites,
+                    "recency": rec,
+                    "weights": weights,
                 }
-            subset.sort(key=lambda x: x.get("_blended_score", 0.0), reverse=True)
+            subset = [subset[i] for i in np.argsort(-blended, kind="stable")]
             hits = subset[:size]
+            _semantic_breaker.record_success()
         except Exception:
+            _semantic_breaker.record_failure()
             hits = hits[:size]
     else:
         hits = hits[:size]
@@ -207,14 +467,7 @@ def ui_search(
     must: list[dict[str, Any]] = []
     filter_q: list[dict[str, Any]] = []
     if q:
-        must.append(
-            {
-                "multi_match": {
-                    "query": q,
-                    "fields": ["title^2", "abstract", "summary"],
-                }
-            }
-        )
+        must.append({"multi_match": {"query": q, "fields": _MULTI_MATCH_FIELDS}})
     # Filters
     if year_start is not None or year_end is not None:
         range_body: dict[str, Any] = {}
@@ -232,22 +485,28 @@ def ui_search(
     if has_summary:
         filter_q.append({"exists": {"field": "summary"}})
 
-    query = {"bool": {"must": must or {"match_all": {}}, "filter": filter_q}}
+    # Results are always sorted by a field, so match in filter context and skip BM25 scoring
+    query = {"bool": {"filter": must + filter_q}}
 
-    sort_clause = [{"fetched_at": {"order": "desc"}}]
-    if sort == "citations":
-        sort_clause = [{"citation_count": {"order": "desc"}}]
+    sort_clause = _SORT_CITATIONS if sort == "citations" else _SORT_RECENCY
 
     start_time = perf_counter()
     res = client.search(
         index=INDEX_NAME,
-        body={"query": query, "size": size, "sort": sort_clause},
+        body={
+            "query": query,
+            "size": size,
+            "sort": sort_clause,
+            "track_scores": False,
+            "track_total_hits": True,
+            "_source": {"includes": _UI_SOURCE_FIELDS},
+        },
     )
     latency_ms = int((perf_counter() - start_time) * 1000)
 
     hits = [
         {
-            "id": int(h.get("_id")) if str(h.get("_id")).isdigit() else h.get("_id"),
+            "id": _hit_id(h),
             **(h.get("_source", {}) or {}),
         }
         for h in res.get("hits", {}).get("hits", [])
@@ -282,7 +541,7 @@ def ui_search(
 @app.post("/ui/report")
 async def ui_report(
     request: Request,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Accept lightweight, privacy-safe UI feedback events.
 
     Expects JSON body like:
@@ -293,32 +552,31 @@ async def ui_report(
       "payload": {"query_hash": "...", "filters": {...}, "note": "optional"}
     }
     """
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
     try:
-        body = await request.json()
+        raw = await request.body()
+        body = orjson.loads(raw) if raw else {}
     except Exception:
         body = {}
 
     if not isinstance(body, dict):
         raise HTTPException(status_code=400, detail="Invalid JSON body")
 
-    event = UiEvent(
-        session_id=str(body.get("session_id") or ""),
-        ui_version=str(body.get("ui_version") or ""),
-        event_type=str(body.get("event_type") or "report"),
-        payload=body.get("payload") or {},
+    await _record_ui_event(
+        request,
+        {
+            "created_at": datetime.now(timezone.utc),
+            "session_id": str(body.get("session_id") or ""),
+            "ui_version": str(body.get("ui_version") or ""),
+            "event_type": str(body.get("event_type") or "report"),
+            "payload": body.get("payload") or {},
+        },
     )
 
-    with session_factory() as session:
-        session.add(event)
-        session.commit()
-
-    return JSONResponse({"ok": True})
+    return ORJSONResponse({"ok": True})
 
 
 @app.post("/ui/telemetry")
-async def ui_telemetry(request: Request) -> JSONResponse:
+async def ui_telemetry(request: Request) -> ORJSONResponse:
     """Persist privacy-safe UI telemetry events.
 
     Expected JSON body (best-effort parsed):
@@ -333,135 +591,106 @@ async def ui_telemetry(request: Request) -> JSONResponse:
     Logging failures should never break the UI, so this endpoint always returns {"ok": true}
     unless the request body is completely unreadable.
     """
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
     try:
-        body = await request.json()
+        raw = await request.body()
+        body = orjson.loads(raw) if raw else {}
     except Exception:
         body = {}
 
     if not isinstance(body, dict):
         # Return 200 with ok:false to avoid client disruption
-        return JSONResponse({"ok": False})
-
-    event = UiEvent(
-        session_id=str(body.get("session_id") or ""),
-        ui_version=str(body.get("ui_version") or ""),
-        event_type=str(body.get("event_type") or "unknown"),
-        payload=body.get("payload") or {},
-    )
+        return ORJSONResponse({"ok": False})
 
     try:
-        with session_factory() as session:
-            session.add(event)
-            session.commit()
+        await _record_ui_event(
+            request,
+            {
+                "created_at": datetime.now(timezone.utc),
+                "session_id": str(body.get("session_id") or ""),
+                "ui_version": str(body.get("ui_version") or ""),
+                "event_type": str(body.get("event_type") or "unknown"),
+                "payload": body.get("payload") or {},
+            },
+        )
     except Exception:
         # Swallow errors to ensure UI is not impacted
-        return JSONResponse({"ok": False})
+        return ORJSONResponse({"ok": False})
 
-    return JSONResponse({"ok": True})
+    return ORJSONResponse({"ok": True})
 
 
-@app.get("/ui/telemetry/metrics")
-def ui_telemetry_metrics(hours: int = Query(24, ge=1, le=168)) -> dict[str, Any]:
-    """Return hourly aggregates for key UI telemetry.
+def _telemetry_buckets(hours: int) -> Iterator[dict[str, Any]]:
+    """Yield hourly UI telemetry aggregates for the last `hours` hours, oldest first.
 
     - zero-result rate computed from search_results where payload.total == 0
     - avg latency_ms from search_results.payload.latency_ms
     - error rate computed from details requests: api_error vs (api_error + details_loaded)
     """
-    settings = Settings.from_env()
-    session_factory = create_session_factory(settings.database_url)
+    session_factory = _get_session_factory()
     window_end = datetime.now(timezone.utc)
     window_start = window_end - timedelta(hours=hours)
 
-    # Collect relevant events in window.
+    is_search = UiEvent.event_type == "search_results"
+    is_details = UiEvent.event_type.in_(("details_loaded", "api_error"))
+    is_error = UiEvent.event_type == "api_error"
+
+    # Bucket and aggregate in the database; only the per-hour totals come back
     with session_factory() as session:
-        # Load minimal columns to Python and aggregate in-memory for simplicity and portability
-        rows = (
-            session.query(UiEvent.created_at, UiEvent.event_type, UiEvent.payload)
-            .filter(UiEvent.created_at >= window_start)
-            .filter(UiEvent.created_at <= window_end)
-            .all()
+        dialect_name = session.get_bind().dialect.name
+        # Non-numeric values count as 0, as a missing field would
+        total = func.coalesce(_payload_number("total", dialect_name), 0)
+        latency = func.coalesce(_payload_number("latency_ms", dialect_name), 0)
+        hour = _hour_bucket(dialect_name).label("hour")
+        stmt = (
+            select(
+                hour,
+                func.sum(case((is_search, 1), else_=0)),
+                func.sum(case((and_(is_search, total == 0), 1), else_=0)),
+                func.avg(case((is_search, latency))),
+                func.sum(case((is_details, 1), else_=0)),
+                func.sum(case((is_error, 1), else_=0)),
+            )
+            .where(UiEvent.created_at >= window_start)
+            .where(UiEvent.created_at <= window_end)
+            .group_by(hour)
         )
+        rows = session.execute(stmt).all()
+
+    buckets: dict[int, dict[str, Any]] = {}
+    for hour_value, searches, zero_searches, avg_latency, details_requests, details_errors in rows:
+        buckets[_epoch_hour(hour_value)] = {
+            "searches": int(searches or 0),
+            "zero_searches": int(zero_searches or 0),
+            "avg_latency_ms": int(avg_latency) if avg_latency is not None else None,
+            "details_requests": int(details_requests or 0),  # details_loaded + api_error
+            "details_errors": int(details_errors or 0),  # api_error only
+        }
 
-    def bucket_start(dt: datetime) -> datetime:
-        return dt.replace(minute=0, second=0, microsecond=0)
-
-    buckets: dict[datetime, dict[str, Any]] = {}
-
-    for created_at, event_type, payload in rows:
-        b = bucket_start(created_at)
-        if b not in buckets:
-            buckets[b] = {
-                "searches": 0,
-                "zero_searches": 0,
-                "latency_sum": 0,
-                "latency_count": 0,
-                "details_requests": 0,  # details_loaded + api_error
-                "details_errors": 0,  # api_error only
-            }
-
-        data = buckets[b]
-        if event_type == "search_results":
-            data["searches"] += 1
-            try:
-                total = int((payload or {}).get("total") or 0)
-            except Exception:
-                total = 0
-            if total == 0:
-                data["zero_searches"] += 1
-            try:
-                latency = int((payload or {}).get("latency_ms") or 0)
-                data["latency_sum"] += latency
-                data["latency_count"] += 1
-            except Exception:
-                pass
-        elif event_type in ("details_loaded", "api_error"):
-            data["details_requests"] += 1
-            if event_type == "api_error":
-                data["details_errors"] += 1
-
-    # Format output chronologically
-    out: list[dict[str, Any]] = []
-    # Ensure all buckets in range appear, even if empty
-    cur = bucket_start(window_start)
-    while cur <= window_end:
-        data = buckets.get(
-            cur,
-            {
-                "searches": 0,
-                "zero_searches": 0,
-                "latency_sum": 0,
-                "latency_count": 0,
-                "details_requests": 0,
-                "details_errors": 0,
-            },
-        )
-        avg_latency = (
-            int(data["latency_sum"] / data["latency_count"]) if data["latency_count"] else None
-        )
+    # Emit chronologically; every hour in range appears, even if empty
+    for cur in range(_epoch_hour(window_start), _epoch_hour(window_end) + 1):
+        data = buckets.get(cur) or _EMPTY_BUCKET
         zero_rate = (data["zero_searches"] / data["searches"]) if data["searches"] else None
         error_rate = (
             (data["details_errors"] / data["details_requests"])
             if data["details_requests"]
             else None
         )
-        out.append(
-            {
-                "hour_start": cur.isoformat(),
-                "searches": data["searches"],
-                "zero_searches": data["zero_searches"],
-                "zero_rate": zero_rate,
-                "avg_latency_ms": avg_latency,
-                "details_requests": data["details_requests"],
-                "details_errors": data["details_errors"],
-                "details_error_rate": error_rate,
-            }
-        )
-        cur = cur + timedelta(hours=1)
+        yield {
+            "hour_start": datetime.fromtimestamp(cur * 3600, tz=timezone.utc).isoformat(),
+            "searches": data["searches"],
+            "zero_searches": data["zero_searches"],
+            "zero_rate": zero_rate,
+            "avg_latency_ms": data["avg_latency_ms"],
+            "details_requests": data["details_requests"],
+            "details_errors": data["details_errors"],
+            "details_error_rate": error_rate,
+        }
+
 
-    return {"window_hours": hours, "buckets": out}
+@app.get("/ui/telemetry/metrics")
+def ui_telemetry_metrics(hours: int = Query(24, ge=1, le=168)) -> ORJSONResponse:
+    """Return hourly aggregates for key UI telemetry (see `_telemetry_buckets`)."""
+    return ORJSONResponse({"window_hours": hours, "buckets": list(_telemetry_buckets(hours))})
 
 
 @app.get("/ui/telemetry/alerts")
@@ -482,20 +711,24 @@ def ui_telemetry_alerts(
     send: int = Query(
         0, description="If 1 and ALERT_WEBHOOK_URL is set, send alert payload to webhook"
     ),
-) -> dict[str, Any]:
+    include_buckets: int = Query(0, description="If 1, include the hourly buckets"),
+) -> ORJSONResponse:
     """Evaluate recent telemetry and report alert conditions.
 
     - Aggregates over the last N hours (default 1).
     - Computes overall zero-result rate and details error rate.
     - If `send=1` and env var `ALERT_WEBHOOK_URL` is set, POSTs the alert JSON there.
+    - Hourly buckets are only included (in the response and webhook) with `include_buckets=1`.
     """
-    metrics = ui_telemetry_metrics(hours=hours)
-    buckets: list[dict[str, Any]] = metrics.get("buckets", [])
-
-    searches = sum(int(b.get("searches") or 0) for b in buckets)
-    zero_searches = sum(int(b.get("zero_searches") or 0) for b in buckets)
-    details_requests = sum(int(b.get("details_requests") or 0) for b in buckets)
-    details_errors = sum(int(b.get("details_errors") or 0) for b in buckets)
+    buckets: list[dict[str, Any]] | None = [] if include_buckets == 1 else None
+    searches = zero_searches = details_requests = details_errors = 0
+    for b in _telemetry_buckets(hours):
+        searches += b["searches"]
+        zero_searches += b["zero_searches"]
+        details_requests += b["details_requests"]
+        details_errors += b["details_errors"]
+        if buckets is not None:
+            buckets.append(b)
 
     zero_rate = (zero_searches / searches) if searches else None
     details_error_rate = (details_errors / details_requests) if details_requests else None
@@ -526,32 +759,29 @@ def ui_telemetry_alerts(
         "alert_zero_rate": zero_rate_alert,
         "alert_details_error_rate": details_error_rate_alert,
         "alert_active": alert_active,
-        "buckets": buckets,
     }
+    if buckets is not None:
+        payload["buckets"] = buckets
 
     # Optional webhook dispatch
     webhook_url = os.environ.get("ALERT_WEBHOOK_URL", "").strip()
     sent = False
     if send == 1 and webhook_url and alert_active:
         try:
-            import json as _json
-            from urllib import request as _urlreq
-
-            data = _json.dumps({"type": "ui_telemetry_alert", "payload": payload}).encode()
-            req = _urlreq.Request(
+            resp = _webhook_session.post(
                 webhook_url,
-                data=data,
+                data=orjson.dumps({"type": "ui_telemetry_alert", "payload": payload}),
                 headers={"Content-Type": "application/json"},
-                method="POST",
+                timeout=5,
             )
-            # Best-effort; ignore failures
-            _urlreq.urlopen(req, timeout=5)  # nosec B310
+            resp.raise_for_status()
             sent = True
         except Exception:
+            # Best-effort; ignore failures
             sent = False
 
     payload["webhook_sent"] = sent
-    return payload
+    return ORJSONResponse(payload)
 
 
 @app.get("/summaries")
@@ -559,16 +789,22 @@ def get_summaries(q: str | None = None, size: int = 10) -> dict[str, Any]:
     """Return summaries for top-N matches for a query (or latest if no query)."""
     client = _get_client()
     if q:
+        # Sorted by recency, so the match needs no scoring
         query: dict[str, Any] = {
-            "bool": {
-                "must": {"multi_match": {"query": q, "fields": ["title^2", "abstract", "summary"]}}
-            }
+            "bool": {"filter": {"multi_match": {"query": q, "fields": _MULTI_MATCH_FIELDS}}}
         }
     else:
         query = {"match_all": {}}
     res = client.search(
         index=INDEX_NAME,
-        body={"query": query, "size": size, "sort": [{"fetched_at": {"order": "desc"}}]},
+        body={
+            "query": query,
+            "size": size,
+            "sort": _SORT_RECENCY,
+            "track_scores": False,
+            "track_total_hits": True,
+            "_source": {"includes": _SUMMARY_SOURCE_FIELDS},
+        },
     )
     items: list[dict[str, Any]] = []
     for h in res.get("hits", {}).get("hits", []):
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from sqlalchemy import JSON as GenericJSON
-from sqlalchemy import DateTime, String, UniqueConstraint
+from sqlalchemy import DateTime, Index, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -60,3 +60,6 @@ class UiEvent(Base):
     payload: Mapped[dict] = mapped_column(
         JSONB().with_variant(GenericJSON(), "sqlite"), default=dict, nullable=False
     )
+
+    # Telemetry metrics/alerts scan a created_at window and branch on event_type
+    __table_args__ = (Index("ix_ui_events_created_type", "created_at", "event_type"),)
@@ -72,6 +72,56 @@ class PerSourceRateLimiter:
 global_rate_limiter = PerSourceRateLimiter()
 
 
+class CircuitBreaker:
+    """Minimal in-process circuit breaker for an unreliable dependency.
+
+    Closed until `failure_threshold` consecutive failures, then open (callers should skip
+    the dependency) for `reset_timeout_seconds`. After that a single trial call is let
+    through (half-open); success closes the breaker, failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_seconds: float = 60.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._lock = Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.reset_timeout_seconds:
+                return "open"
+            return "half-open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout_seconds:
+                return False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
 def http_get_json(
     url: str,
     *,
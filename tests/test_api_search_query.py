@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import pytest
 from fastapi.testclient import TestClient
 
 import ingestion.api as api_mod
@@ -48,11 +49,13 @@ def test_search_builds_expected_filters(monkeypatch):
 
     body = fake.last_body
     assert body is not None
-    # Must include multi_match
-    must = body["query"]["bool"]["must"]
-    assert any("multi_match" in m for m in (must if isinstance(must, list) else [must]))
-    # Filters include author, year range, license, source
+    # Keyword match runs in (non-scoring) filter context alongside the filters
     filters = body["query"]["bool"]["filter"]
+    assert any("multi_match" in f for f in filters)
+    assert "must" not in body["query"]["bool"]
+    assert body["track_scores"] is False
+    assert body["track_total_hits"] is True
+    # Filters include author, year range, license, source
     assert {"term": {"authors": "Alice"}} in filters
     assert {"term": {"license": "cc-by"}} in filters
     assert {"term": {"source": "openalex"}} in filters
@@ -61,3 +64,110 @@ def test_search_builds_expected_filters(monkeypatch):
     assert rng["range"]["year"]["lte"] == 2022
     # Sort by citations
     assert body["sort"] == [{"citation_count": {"order": "desc"}}]
+    # Without semantic re-ranking only the requested page is fetched
+    assert body["size"] == 10
+    assert "title" in body["_source"]["includes"]
+
+
+def test_search_size_zero_returns_total_only(monkeypatch):
+    class _Client(_FakeSearchClient):
+        def search(self, *, index: str, body: dict[str, Any]) -> dict[str, Any]:  # type: ignore[override]
+            super().search(index=index, body=body)
+            return {"hits": {"total": {"value": 42}, "hits": []}}
+
+    fake = _Client()
+    monkeypatch.setattr(api_mod, "_get_client", lambda: fake)
+    monkeypatch.setenv("ENABLE_SEMANTIC", "1")
+
+    r = TestClient(app).get("/search", params={"q": "transformer", "size": 0})
+    assert r.status_code == 200
+    assert r.json() == {"total": 42, "hits": []}
+    # No over-fetch for re-ranking when only the total is wanted
+    assert fake.last_body is not None
+    assert fake.last_body["size"] == 0
+
+
+def test_search_skips_over_fetch_while_breaker_open(monkeypatch):
+    from ingestion.utils import CircuitBreaker
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=60.0)
+    breaker.record_failure()
+    fake = _FakeSearchClient()
+    monkeypatch.setattr(api_mod, "_get_client", lambda: fake)
+    monkeypatch.setattr(api_mod, "_semantic_breaker", breaker)
+    monkeypatch.setenv("ENABLE_SEMANTIC", "1")
+
+    r = TestClient(app).get("/search", params={"q": "transformer", "size": 5})
+    assert r.status_code == 200
+    # Re-ranking is skipped, so only the requested page is fetched
+    assert fake.last_body is not None
+    assert fake.last_body["size"] == 5
+    assert breaker.state == "open"
+
+
+class _FakeModel:
+    """Maps each text to a fixed unit vector so cosine similarity is predictable."""
+
+    def __init__(self, vectors: dict[str, list[float]]) -> None:
+        self.vectors = vectors
+        self.calls = 0
+
+    def encode(self, texts: list[str], **_: Any) -> Any:
+        import numpy as np
+
+        self.calls += 1
+        return np.array([self.vectors[t] for t in texts], dtype=np.float32)
+
+
+def test_search_semantic_rerank_blends_scores(monkeypatch):
+    pytest.importorskip("numpy")
+
+    class _Client(_FakeSearchClient):
+        def search(self, *, index: str, body: dict[str, Any]) -> dict[str, Any]:  # type: ignore[override]
+            self.last_body = body
+            return {
+                "hits": {
+                    "total": {"value": 2},
+                    "hits": [
+                        {"_id": "1", "_source": {"title": "far", "year": 2020}},
+                        {"_id": "2", "_source": {"title": "near", "year": 2020}},
+                    ],
+                }
+            }
+
+    model = _FakeModel({"q": [1.0, 0.0], "far": [0.0, 1.0], "near": [1.0, 0.0]})
+    monkeypatch.setattr(api_mod, "_get_client", lambda: _Client())
+    monkeypatch.setattr(api_mod, "_semantic_model", lambda _name: model)
+    monkeypatch.setenv("ENABLE_SEMANTIC", "1")
+    monkeypatch.setenv("WEIGHT_CITATIONS", "0")
+    monkeypatch.setenv("WEIGHT_RECENCY", "0")
+
+    r = TestClient(app).get("/search", params={"q": "q", "size": 2})
+    assert r.status_code == 200
+    hits = r.json()["hits"]
+    assert [h["id"] for h in hits] == [2, 1]
+    assert hits[0]["ranking_breakdown"]["semantic"] == pytest.approx(1.0)
+    assert hits[1]["ranking_breakdown"]["semantic"] == pytest.approx(0.0)
+    # Query and corpus are embedded in one batch
+    assert model.calls == 1
+
+
+def test_orjson_serializer_round_trips_search_bodies():
+    from datetime import datetime, timezone
+
+    np = pytest.importorskip("numpy")
+    ser = api_mod.OrjsonSerializer()
+    body = {
+        "query": {"multi_match": {"query": "x", "fields": api_mod._MULTI_MATCH_FIELDS}},
+        "sort": api_mod._SORT_RECENCY,
+        "after": datetime(2024, 1, 2, tzinfo=timezone.utc),
+        "vec": np.array([1.0, 2.0]),
+    }
+    raw = ser.dumps(body)
+    assert isinstance(raw, bytes)
+    decoded = ser.loads(raw)
+    assert decoded["query"]["multi_match"]["fields"] == ["title^2", "abstract", "summary"]
+    assert decoded["after"] == "2024-01-02T00:00:00+00:00"
+    assert decoded["vec"] == [1.0, 2.0]
+    # Pre-serialized bodies pass through untouched
+    assert ser.dumps('{"a":1}') == '{"a":1}'
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from ingestion.utils import PerSourceRateLimiter, license_permits_pdf_storage, normalize_license
+from ingestion.utils import (
+    CircuitBreaker,
+    PerSourceRateLimiter,
+    license_permits_pdf_storage,
+    normalize_license,
+)
 
 
 def test_license_normalization_and_policy():
@@ -21,3 +26,24 @@ def test_per_source_rate_limiter_basic():
     elapsed = __import__("time").monotonic() - start
     # Two calls should incur ~0.2s total at minimum; allow slack on CI
     assert elapsed >= 0.18
+
+
+def test_circuit_breaker_opens_and_recovers():
+    cb = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=0.05)
+    assert cb.allow()
+    cb.record_failure()
+    assert cb.state == "closed"
+    cb.record_failure()
+    assert cb.state == "open"
+    assert not cb.allow()
+    __import__("time").sleep(0.06)
+    # Half-open: exactly one trial call goes through
+    assert cb.allow()
+    assert not cb.allow()
+    cb.record_failure()
+    assert cb.state == "open"
+    __import__("time").sleep(0.06)
+    assert cb.allow()
+    cb.record_success()
+    assert cb.state == "closed"
+    assert cb.allow()
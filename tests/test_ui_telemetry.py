@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+import ingestion.api as api_mod
+from ingestion.api import app
+from ingestion.db import Base, create_session_factory, ensure_schema
+
+
+@pytest.fixture(autouse=True)
+def _set_test_db(tmp_path) -> Iterator[None]:
+    os.environ["DATABASE_URL"] = "sqlite:///" + str(tmp_path / "test.db")
+    session_factory = create_session_factory(os.environ["DATABASE_URL"])
+    with session_factory() as session:
+        engine = session.get_bind()
+        ensure_schema(Base, engine)
+        Base.metadata.create_all(engine)
+    yield
+
+
+def _post(client: TestClient, event_type: str, payload: dict) -> None:
+    r = client.post(
+        "/ui/telemetry",
+        json={"session_id": "s", "ui_version": "v1", "event_type": event_type, "payload": payload},
+    )
+    assert r.status_code == 200
+    assert r.json() == {"ok": True}
+
+
+def test_telemetry_metrics_aggregates_current_hour():
+    client = TestClient(app)
+    _post(client, "search_results", {"total": 3, "latency_ms": 100})
+    _post(client, "search_results", {"total": 0, "latency_ms": 50})
+    _post(client, "search_results", {"total": 0, "latency_ms": None})
+    _post(client, "details_loaded", {"id": 1, "latency_ms": 10})
+    _post(client, "api_error", {"endpoint": "/paper/1", "status": 500})
+    _post(client, "star_toggled", {"id": 1, "active": 1})
+
+    r = client.get("/ui/telemetry/metrics", params={"hours": 2})
+    assert r.status_code == 200
+    buckets = r.json()["buckets"]
+    assert len(buckets) in (2, 3)
+    current = buckets[-1]
+    assert current["searches"] == 3
+    assert current["zero_searches"] == 2
+    assert current["zero_rate"] == pytest.approx(2 / 3)
+    assert current["avg_latency_ms"] == 50
+    assert current["details_requests"] == 2
+    assert current["details_errors"] == 1
+    assert current["details_error_rate"] == pytest.approx(0.5)
+    assert all(b["searches"] == 0 and b["avg_latency_ms"] is None for b in buckets[:-1])
+
+
+def test_telemetry_metrics_tolerate_non_numeric_payloads():
+    client = TestClient(app)
+    _post(client, "search_results", {"total": "", "latency_ms": "slow"})
+    _post(client, "search_results", {"total": "n/a", "latency_ms": True})
+    _post(client, "search_results", {"total": True, "latency_ms": {"ms": 1}})
+    _post(client, "search_results", {"total": "7", "latency_ms": "40"})
+    _post(client, "search_results", {"total": 2, "latency_ms": 90})
+
+    r = client.get("/ui/telemetry/metrics", params={"hours": 1})
+    assert r.status_code == 200
+    current = r.json()["buckets"][-1]
+    assert current["searches"] == 5
+    # Non-numeric values count as 0, like a missing field
+    assert current["zero_searches"] == 4
+    assert current["avg_latency_ms"] == 18
+    assert client.get("/ui/telemetry/alerts").status_code == 200
+
+
+def test_payload_number_guards_cast_on_postgres():
+    from sqlalchemy.dialects import postgresql
+
+    sql = str(api_mod._payload_number("total", "postgresql").compile(dialect=postgresql.dialect()))
+    assert "jsonb_typeof" in sql
+    assert sql.index("jsonb_typeof") < sql.index("CAST")
+
+
+def test_hour_bucket_truncates_in_utc_on_postgres():
+    from sqlalchemy.dialects import postgresql
+
+    sql = str(api_mod._hour_bucket("postgresql").compile(dialect=postgresql.dialect()))
+    assert sql.startswith("date_trunc(")
+    assert "timezone(" in sql
+
+
+def test_telemetry_is_batched_and_flushed_on_shutdown(monkeypatch):
+    batches: list[int] = []
+    insert_rows = api_mod._insert_ui_events
+
+    def _recording_insert(rows):
+        batches.append(len(rows))
+        insert_rows(rows)
+
+    monkeypatch.setattr(api_mod, "_insert_ui_events", _recording_insert)
+    with TestClient(app) as client:
+        assert app.state.telemetry_queue is not None
+        for _ in range(5):
+            _post(client, "search_results", {"total": 1, "latency_ms": 20})
+    # Lifespan shutdown drains the write-behind queue
+    assert app.state.telemetry_queue is None
+    assert sum(batches) == 5
+    assert len(batches) < 5
+
+    r = TestClient(app).get("/ui/telemetry/metrics", params={"hours": 1})
+    assert r.json()["buckets"][-1]["searches"] == 5
+
+
+def test_telemetry_batch_failure_drops_only_bad_rows(monkeypatch):
+    insert_rows = api_mod._insert_ui_events
+
+    def _rejecting_insert(rows):
+        # Stand-in for a value the database refuses, e.g. "\u0000" in a Postgres JSONB column
+        if any(row["payload"].get("bad") for row in rows):
+            raise ValueError("rejected payload")
+        insert_rows(rows)
+
+    monkeypatch.setattr(api_mod, "_insert_ui_events", _rejecting_insert)
+    with TestClient(app) as client:
+        _post(client, "search_results", {"total": 1, "latency_ms": 20})
+        _post(client, "search_results", {"total": 1, "latency_ms": 20, "bad": True})
+        _post(client, "search_results", {"total": 1, "latency_ms": 20})
+
+    r = TestClient(app).get("/ui/telemetry/metrics", params={"hours": 1})
+    assert r.json()["buckets"][-1]["searches"] == 2
+
+
+def test_telemetry_alerts_thresholds():
+    client = TestClient(app)
+    for _ in range(3):
+        _post(client, "search_results", {"total": 0, "latency_ms": 5})
+
+    r = client.get("/ui/telemetry/alerts", params={"min_searches": 3, "zero_rate_gt": 0.5})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["searches"] == 3
+    assert body["alert_zero_rate"] is True
+    assert body["alert_details_error_rate"] is False
+    assert body["alert_active"] is True
+    assert body["webhook_sent"] is False
+    assert "buckets" not in body
+
+    r = client.get("/ui/telemetry/alerts", params={"include_buckets": 1})
+    buckets = r.json()["buckets"]
+    assert sum(b["searches"] for b in buckets) == 3
+
+
+class _FakeWebhookSession:
+    def __init__(self) -> None:
+        self.posts: list[tuple[str, bytes]] = []
+
+    def post(self, url: str, *, data: bytes, **_: object) -> object:
+        self.posts.append((url, data))
+
+        class _Resp:
+            def raise_for_status(self) -> None:
+                return None
+
+        return _Resp()
+
+
+def test_telemetry_alerts_send_webhook(monkeypatch):
+    fake = _FakeWebhookSession()
+    monkeypatch.setattr(api_mod, "_webhook_session", fake)
+    monkeypatch.setenv("ALERT_WEBHOOK_URL", "https://hooks.example.test/alert")
+    client = TestClient(app)
+    _post(client, "search_results", {"total": 0, "latency_ms": 5})
+
+    r = client.get("/ui/telemetry/alerts", params={"min_searches": 1, "send": 1})
+    assert r.status_code == 200
+    assert r.json()["webhook_sent"] is True
+    assert len(fake.posts) == 1
+    url, data = fake.posts[0]
+    assert url == "https://hooks.example.test/alert"
+    assert b'"type":"ui_telemetry_alert"' in data
@@ -1,24 +1,213 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import pathlib
+import sys
+from typing import Any
+from urllib.parse import urlsplit
+
 import pytest
-from playwright.sync_api import Browser, Page, sync_playwright
+from playwright.sync_api import BrowserContext, BrowserType, Page, Route
+from playwright.sync_api import Error as PlaywrightError
+
+ARTIFACTS_DIR = pathlib.Path("artifacts/ui-e2e")
+# Per-worker browser profile dirs (suffixed with the xdist worker id), reused across runs
+PROFILE_DIR_PREFIX = "artifacts/pw-profile-"
+_DISK_CACHE_BYTES = 100 * 1024 * 1024
+_CLEARED_STORAGE = "local_storage,indexeddb,cache_storage,service_workers"
+
+# Repo root on sys.path so tests can import `scripts.*` in-process
+_REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+# never: no tracing/video; on_failure (default): lightweight trace, saved only for failed
+# tests; full: screenshots, sources and video too, e.g. for `UI_E2E_CAPTURE=full pytest --lf`
+UI_E2E_CAPTURE = os.environ.get("UI_E2E_CAPTURE", "on_failure")
+_TRACING = UI_E2E_CAPTURE != "never"
+_FULL_CAPTURE = UI_E2E_CAPTURE == "full"
+
+# Freeze CSS animations/transitions (e.g. the loading spinners) so screenshots are stable
+_NO_MOTION_SCRIPT = """
+document.addEventListener("DOMContentLoaded", () => {
+  const style = document.createElement("style");
+  style.textContent = "*, *::before, *::after { animation: none !important; " +
+    "transition: none !important; scroll-behavior: auto !important; }";
+  document.head.appendChild(style);
+});
+"""
+
+# Recorded backend responses replayed by `pw_mocked`; re-record with PYTEST_RECORD=1. Only the
+# page's XHR/beacon calls: /ui/search itself is server-rendered and must come from the live app
+FIXTURES_DIR = pathlib.Path(__file__).parent / "fixtures"
+MOCKED_ROUTES = ("**/paper/*", "**/ui/report", "**/ui/telemetry")
+_RECORD = os.environ.get("PYTEST_RECORD") == "1"
+# Fire-and-forget POSTs whose bodies carry timestamps/session ids; replayed regardless of body
+_BODY_AGNOSTIC_ROUTES = {("POST", "/ui/telemetry"), ("POST", "/ui/report")}
+# Let Playwright recompute these for the replayed body
+_DROPPED_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "date"}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Expose each phase's report on the item so fixtures can tell whether the test failed
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
+
+
+@pytest.fixture(scope="session")
+def base_url() -> str:
+    """Server under test (overrides pytest-base-url's fixture of the same name)."""
+    return os.environ.get("BASE_URL", "http://localhost:8000").rstrip("/")
+
+
+@pytest.fixture(scope="session")
+def search_url(base_url: str) -> str:
+    return f"{base_url}/ui/search"
 
 
 @pytest.fixture(scope="session")
-def browser() -> Browser:
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        try:
-            yield browser
-        finally:
-            browser.close()
+def browser_context_args(browser_context_args: dict[str, Any]) -> dict[str, Any]:
+    # Applied to the persistent context in `shared_context` (one browser launch per worker)
+    args = {**browser_context_args, "reduced_motion": "reduce"}
+    if _FULL_CAPTURE:
+        args["record_video_dir"] = str(ARTIFACTS_DIR / "videos")
+    return args
+
+
+@pytest.fixture(scope="session")
+def shared_context(
+    browser_type: BrowserType,
+    browser_type_launch_args: dict[str, Any],
+    browser_context_args: dict[str, Any],
+    worker_id: str,
+) -> BrowserContext:
+    """One persistent context (and tracing session) per xdist worker; tests get their own pages.
+
+    The on-disk profile keeps the V8 code cache warm across tests and runs (Playwright
+    bypasses the HTTP cache while request routes are installed).
+    """
+    options: dict[str, Any] = {**browser_type_launch_args, **browser_context_args}
+    if browser_type.name == "chromium":
+        options["args"] = [*options.get("args", []), f"--disk-cache-size={_DISK_CACHE_BYTES}"]
+    context = browser_type.launch_persistent_context(f"{PROFILE_DIR_PREFIX}{worker_id}", **options)
+    context.add_init_script(_NO_MOTION_SCRIPT)
+    if _TRACING:
+        context.tracing.start(screenshots=_FULL_CAPTURE, snapshots=True, sources=_FULL_CAPTURE)
+    try:
+        yield context
+    finally:
+        if _TRACING:
+            context.tracing.stop()
+        context.close()
+
+
+def _send_cdp(page: Page, *commands: tuple[str, dict[str, Any]]) -> None:
+    """Run one-off CDP commands against `page`; a no-op outside Chromium."""
+    try:
+        cdp = page.context.new_cdp_session(page)
+    except PlaywrightError:
+        return
+    try:
+        for method, params in commands:
+            cdp.send(method, params)
+    finally:
+        cdp.detach()
 
 
 @pytest.fixture()
-def page(browser: Browser) -> Page:
-    context = browser.new_context()
+def page(shared_context: BrowserContext, base_url: str, request: pytest.FixtureRequest) -> Page:
+    name = request.node.name
+    shared_context.clear_cookies()
+    if _TRACING:
+        shared_context.tracing.start_chunk(title=name)
+    page = shared_context.new_page()
+    parts = urlsplit(base_url)
+    # Don't leak stars/session ids into this test from earlier tests or runs; the profile
+    # persists, but only its caches should
+    _send_cdp(
+        page,
+        (
+            "Storage.clearDataForOrigin",
+            {"origin": f"{parts.scheme}://{parts.netloc}", "storageTypes": _CLEARED_STORAGE},
+        ),
+    )
     try:
-        page = context.new_page()
         yield page
     finally:
-        context.close()
+        rep_call = getattr(request.node, "rep_call", None)
+        failed = rep_call is not None and rep_call.failed
+        page.close()
+        if _TRACING:
+            if failed:
+                trace_path = ARTIFACTS_DIR / "traces" / f"{name}.zip"
+                shared_context.tracing.stop_chunk(path=str(trace_path))
+            else:
+                shared_context.tracing.stop_chunk()
+        if failed and page.video:
+            page.video.save_as(str(ARTIFACTS_DIR / "videos" / f"{name}.webm"))
+        if page.video:
+            page.video.delete()
+
+
+def _route_keys(route: Route) -> tuple[str, str | None]:
+    """Exact key (method, path+query, body hash) plus, for telemetry/report, a fallback key.
+
+    Keys ignore scheme/host so fixtures replay against any BASE_URL. Telemetry and report
+    bodies differ on every run, so those replay the last response recorded for method + path;
+    everything else must match exactly.
+    """
+    req = route.request
+    parts = urlsplit(req.url)
+    target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    body_hash = hashlib.sha1(req.post_data_buffer or b"").hexdigest()[:12]
+    fallback = None
+    if (req.method, parts.path) in _BODY_AGNOSTIC_ROUTES:
+        fallback = f"{req.method} {parts.path} *"
+    return f"{req.method} {target} {body_hash}", fallback
+
+
+@pytest.fixture()
+def pw_mocked(page: Page, request: pytest.FixtureRequest) -> dict[str, dict]:
+    """Serve the UI's backend calls from `ui-tests/fixtures/<test module>.json`.
+
+    With PYTEST_RECORD=1 (`make e2e-record`, against the seeded demo corpus) requests go to
+    the live server and the responses are saved. On replay, anything not in the fixture file
+    (or every request, until the module's file is recorded) falls through to the live server.
+    """
+    fixture_path = FIXTURES_DIR / f"{request.path.stem}.json"
+    cache: dict[str, dict] = {}
+    if not _RECORD and fixture_path.exists():
+        cache = json.loads(fixture_path.read_text(encoding="utf-8"))
+
+    def _handle(route: Route) -> None:
+        key, fallback = _route_keys(route)
+        if _RECORD:
+            response = route.fetch()
+            entry = {
+                "status": response.status,
+                "headers": {k: v for k, v in response.headers.items() if k not in _DROPPED_HEADERS},
+                "body": response.text(),
+            }
+            cache[key] = entry
+            if fallback is not None:
+                cache[fallback] = entry
+            route.fulfill(response=response)
+            return
+        entry = cache.get(key)
+        if entry is None and fallback is not None:
+            entry = cache.get(fallback)
+        if entry is None:
+            route.continue_()
+            return
+        route.fulfill(status=entry["status"], headers=entry["headers"], body=entry["body"])
+
+    for pattern in MOCKED_ROUTES:
+        page.route(pattern, _handle)
+    yield cache
+    if _RECORD:
+        FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+        fixture_path.write_text(json.dumps(cache, indent=2, sort_keys=True) + "\n", "utf-8")
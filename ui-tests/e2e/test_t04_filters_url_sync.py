@@ -1,19 +1,40 @@
 from __future__ import annotations
 
-import os
 import pathlib
 from urllib.parse import parse_qs, urlparse
 
+import pytest
 from playwright.sync_api import Page, expect
 
+# Read every filter control in one round-trip; values are server-rendered from the URL
+_FORM_STATE_JS = """() => {
+  const field = (name) => document.querySelector(`[name=${name}]`);
+  return {
+    source: field("source").value,
+    license: field("license").value,
+    venue: field("venue").value,
+    year_start: field("year_start").value,
+    year_end: field("year_end").value,
+    has_summary: field("has_summary").checked,
+  };
+}"""
+_EXPECTED_STATE = {
+    "source": "arxiv",
+    "license": "cc-by",
+    "venue": "DemoConf",
+    "year_start": "2023",
+    "year_end": "2025",
+    "has_summary": True,
+}
 
-def test_t04_filters_and_url_sync(page: Page) -> None:
-    base_url = os.environ.get("BASE_URL", "http://localhost:8000").rstrip("/")
+
+@pytest.mark.usefixtures("pw_mocked")
+def test_t04_filters_and_url_sync(page: Page, search_url: str) -> None:
     artifacts_dir = pathlib.Path("artifacts/ui-e2e")
     artifacts_dir.mkdir(parents=True, exist_ok=True)
 
     # Open seeded query
-    page.goto(f"{base_url}/ui/search?q=transformer")
+    page.goto(f"{search_url}?q=transformer", wait_until="domcontentloaded")
 
     # Set filters: source=arxiv (may zero results), license=cc-by, venue=DemoConf, year range, has_summary
     page.select_option("select[name=source]", "arxiv")
@@ -44,19 +65,14 @@ def test_t04_filters_and_url_sync(page: Page) -> None:
     expect(rows.or_(empty)).to_be_visible()
 
     # Hard refresh preserves state
-    page.reload()
-    expect(page.locator("select[name=source]")).to_have_value("arxiv")
-    expect(page.locator("select[name=license]")).to_have_value("cc-by")
-    expect(page.locator("input[name=venue]")).to_have_value("DemoConf")
-    expect(page.locator("input[name=year_start]")).to_have_value("2023")
-    expect(page.locator("input[name=year_end]")).to_have_value("2025")
-    expect(page.locator("input[name=has_summary]")).to_be_checked()
-
-    # Copying the URL reproduces state
-    url_copy = page.url
-    page.goto(f"{base_url}/ui/search?q=transformer")
-    page.goto(url_copy)
-    expect(page.locator("select[name=source]")).to_have_value("arxiv")
+    page.reload(wait_until="domcontentloaded")
+    assert page.evaluate(_FORM_STATE_JS) == _EXPECTED_STATE
+
+    # Copying the URL reproduces state (fresh navigation, so no browser form restoration)
+    page.goto(page.url, wait_until="domcontentloaded")
+    assert page.evaluate(_FORM_STATE_JS) == _EXPECTED_STATE
 
     # Artifact: screenshot of filtered view
-    page.screenshot(path=str(artifacts_dir / "t04-filters.png"), full_page=True)
+    page.screenshot(
+        path=str(artifacts_dir / "t04-filters.png"), animations="disabled", caret="hide"
+    )
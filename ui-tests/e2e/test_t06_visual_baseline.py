@@ -1,41 +1,49 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import pathlib
 
-from PIL import Image, ImageChops
+import numpy as np
+from PIL import Image
 from playwright.sync_api import Page
 
+# Per-channel difference treated as antialiasing noise rather than a visual change
+_PIXEL_TOLERANCE = 3
+# Hamming distance between 64-bit difference hashes still considered "the same page"
+_DHASH_MAX_DISTANCE = 5
+# Rewrite the committed baseline instead of comparing against it, e.g. after an intended change
+_UPDATE_BASELINE = os.environ.get("UPDATE_BASELINE") == "1"
+
 
 def _ensure_dir(path: pathlib.Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def test_t06_visual_baseline(page: Page) -> None:
-    base_url = os.environ.get("BASE_URL", "http://localhost:8000").rstrip("/")
-    artifacts_dir = pathlib.Path("artifacts/ui-e2e")
-    baseline_dir = pathlib.Path("ui-tests/snapshots")
-    _ensure_dir(artifacts_dir)
-    _ensure_dir(baseline_dir)
+def _dhash(img: Image.Image, size: int = 8) -> int:
+    """Perceptual difference hash: one bit per horizontal brightness gradient."""
+    gray = np.asarray(
+        img.convert("L").resize((size + 1, size), Image.Resampling.LANCZOS), dtype=np.int16
+    )
+    bits = (gray[:, 1:] > gray[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
 
-    # Capture current screenshot
-    url = f"{base_url}/ui/search?q=transformer"
-    page.goto(url)
-    current_path = artifacts_dir / "t06-current.png"
-    page.screenshot(path=str(current_path), full_page=True)
 
-    # Baseline handling
-    baseline_path = baseline_dir / "t06-search-baseline.png"
-    if not baseline_path.exists():
-        # Establish baseline on first run
-        baseline_path.write_bytes(current_path.read_bytes())
-        return
+def _describe_pixel_diff(
+    baseline_path: pathlib.Path, current_path: pathlib.Path, diff_path: pathlib.Path
+) -> tuple[bool, str]:
+    """Compare screenshots; write a change mask to `diff_path` when they visibly differ.
 
-    # Compare with baseline
+    Returns whether pixels visibly changed, plus a one-line description.
+    """
+    # Screenshots are opaque, so decode as RGB and skip the constant alpha channel
     with (
-        Image.open(baseline_path).convert("RGBA") as img_base,
-        Image.open(current_path).convert("RGBA") as img_cur,
+        Image.open(baseline_path).convert("RGB") as img_base,
+        Image.open(current_path).convert("RGB") as img_cur,
     ):
+        distance = (_dhash(img_base) ^ _dhash(img_cur)).bit_count()
+        if distance <= _DHASH_MAX_DISTANCE:
+            return False, f"no visible change (dHash distance {distance})"
         # Resize to the smallest common size to avoid DPI/noise mismatch causing exceptions
         w = min(img_base.width, img_cur.width)
         h = min(img_base.height, img_cur.height)
@@ -43,16 +51,63 @@ def test_t06_visual_baseline(page: Page) -> None:
             img_base = img_base.resize((w, h))
         if img_cur.size != (w, h):
             img_cur = img_cur.resize((w, h))
-        diff = ImageChops.difference(img_base, img_cur)
-        bbox = diff.getbbox()
-        if bbox is None:
-            # No diff
-            return
-        # Save diff artifact and fail
-        diff_path = artifacts_dir / "t06-diff.png"
-        diff.save(diff_path)
+        arr_base = np.asarray(img_base, dtype=np.int16)
+        arr_cur = np.asarray(img_cur, dtype=np.int16)
+    mask = np.any(np.abs(arr_base - arr_cur) > _PIXEL_TOLERANCE, axis=-1)
+    rows = np.any(mask, axis=1)
+    if not rows.any():
+        return False, f"only the page size changed (dHash distance {distance})"
+    cols = np.any(mask, axis=0)
+    top, bottom = int(np.argmax(rows)), len(rows) - int(np.argmax(rows[::-1]))
+    left, right = int(np.argmax(cols)), len(cols) - int(np.argmax(cols[::-1]))
+    # Changed pixels in white
+    Image.fromarray(mask.astype(np.uint8) * 255).save(diff_path)
+    return True, f"pixels changed in box {(left, top, right, bottom)} (dHash distance {distance})"
+
+
+def test_t06_visual_baseline(page: Page, search_url: str) -> None:
+    artifacts_dir = pathlib.Path("artifacts/ui-e2e")
+    baseline_dir = pathlib.Path("ui-tests/snapshots")
+    _ensure_dir(artifacts_dir)
+    _ensure_dir(baseline_dir)
+
+    url = f"{search_url}?q=transformer"
+    page.goto(url, wait_until="domcontentloaded")
+
+    # Primary gate: hash of the rendered results markup; no rasterizing on the happy path
+    html = page.evaluate("() => document.querySelector('#results').outerHTML")
+    digest = hashlib.blake2b(html.encode("utf-8"), digest_size=16).hexdigest()
+    hash_path = baseline_dir / "t06.hash"
+    baseline_path = baseline_dir / "t06-search-baseline.png"
+    if _UPDATE_BASELINE:
+        hash_path.write_text(f"{digest}\n", encoding="utf-8")
+        page.screenshot(path=str(baseline_path), full_page=True, animations="disabled", scale="css")
+        return
+    expected = hash_path.read_text(encoding="utf-8").strip() if hash_path.exists() else None
+    if digest == expected:
+        return
+
+    # Mismatch: capture the page (full page, animations frozen, 1 CSS px per image px)
+    current_path = artifacts_dir / "t06-current.png"
+    page.screenshot(path=str(current_path), full_page=True, animations="disabled", scale="css")
+    (artifacts_dir / "t06-results.html").write_text(html, encoding="utf-8")
+    changed, detail = True, "no screenshot baseline"
+    if baseline_path.exists():
+        changed, detail = _describe_pixel_diff(
+            baseline_path, current_path, artifacts_dir / "t06-diff.png"
+        )
         # Also copy baseline for convenience
         (artifacts_dir / "t06-baseline.png").write_bytes(baseline_path.read_bytes())
+    if expected is None:
+        # No DOM hash recorded yet: the committed screenshot is the only baseline
+        if not changed:
+            return
         raise AssertionError(
-            "Visual diff detected. Review artifacts/ui-e2e/t06-diff.png and update baseline if intended."
+            f"Visual diff detected: {detail}. Review artifacts/ui-e2e/t06-diff.png, then "
+            "re-run with UPDATE_BASELINE=1 and commit ui-tests/snapshots if intended."
         )
+    raise AssertionError(
+        f"Results DOM changed ({expected} -> {digest}); {detail}. Review "
+        "artifacts/ui-e2e/t06-current.png and t06-results.html, then re-run "
+        "with UPDATE_BASELINE=1 and commit ui-tests/snapshots if intended."
+    )